@@ -9,8 +9,8 @@ bl_info = {
 }
 
 import bpy
-import bmesh
 import math
+import zlib
 
 # --- Constants for Object Names ---
 NAME_DOME_SHELL = "VSE_Dome_Shell"
@@ -18,6 +18,11 @@ NAME_DOME_FLOOR = "VSE_Dome_Floor"
 NAME_ENV_CATCHER = "VSE_Shadow_Catcher"
 NAME_SUN = "VSE_Sun"
 
+# --- Constants for Materials ---
+MAT_DOME_FLOOR = "VSE_Dome_Mat_Floor"
+MAT_DOME_SHELL = "VSE_Dome_Mat_Shell"
+NODE_IMAGE = "VSE_Image"
+
 def get_strip_path(context):
     scene = context.scene
     if not scene.sequence_editor or not scene.sequence_editor.active_strip:
@@ -35,162 +40,347 @@ def get_strip_path(context):
     return bpy.path.abspath(path)
 
 def setup_cycles():
-    bpy.context.scene.render.engine = 'CYCLES'
+    # Assigning the engine triggers a full engine switch, even to the same value
+    scene = bpy.context.scene
+    if scene.render.engine != 'CYCLES':
+        scene.render.engine = 'CYCLES'
+
+def delete_existing_objects(names):
+    """
+    Deletes the objects that exist by name, together with their mesh/light data
+    when nothing else uses it, in a single batch.
+    """
+    objects = bpy.data.objects
+    targets = [obj for obj in map(objects.get, names) if obj is not None]
+    if not targets:
+        return
+    data = {obj.data for obj in targets if obj.data is not None and obj.data.users == 1}
+    bpy.data.batch_remove(ids=targets + list(data))
 
-def delete_existing_object(name):
-    """Checks if an object exists by name and deletes it."""
-    if name in bpy.data.objects:
-        obj = bpy.data.objects[name]
-        bpy.data.objects.remove(obj, do_unlink=True)
+def load_image_cached(filepath):
+    """Returns an already loaded image for filepath, loading it only on a miss."""
+    images = bpy.data.images
+    abs_path = bpy.path.abspath(filepath)
+    for img in images:
+        if img.filepath and bpy.path.abspath(img.filepath) == abs_path:
+            return img
+    img = images.load(abs_path, check_existing=True)
+    # Float HDRIs are already linear, skip the color transform when sampling.
+    # Only the Color output is used, so alpha handling can be skipped too.
+    if abs_path.lower().endswith(('.exr', '.hdr')):
+        img.colorspace_settings.name = 'Non-Color'
+        img.alpha_mode = 'NONE'
+    return img
 
-def redistribute_floor_geometry(obj):
+def rebind_image(node, image):
     """
-    Redistributes the vertex rings of a flattened sphere (Sine distribution)
-    to a Linear distribution (ArcSin). 
+    Points node at image and removes the image it used before,
+    but only if nothing else uses it any more.
     """
-    bpy.ops.object.mode_set(mode='OBJECT')
-    mesh = obj.data
+    previous = node.image
+    node.image = image
+    if previous is not None and previous != image and previous.users == 0:
+        bpy.data.images.remove(previous)
+
+def ensure_world_nodes(world, image):
+    """
+    Points the world's Environment Texture at image, building the
+    Env Tex -> Background -> Output graph only if it isn't already there.
+    """
+    nodes = world.node_tree.nodes
+    links = world.node_tree.links
+    tagged = {node.label: node for node in nodes if node.label.startswith("VSE_")}
+    tex = tagged.get("VSE_Env_Tex")
+    bg = tagged.get("VSE_Background")
+    out = tagged.get("VSE_Output")
     
-    for v in mesh.vertices:
-        # Get current radius (0.0 to 1.0)
-        x, y = v.co.x, v.co.y
-        current_r = math.sqrt(x*x + y*y)
-        
-        # Only process if not center and within bounds
-        if current_r > 0.0001:
-            # Clamp to 1.0 to avoid math domain errors
-            curr_r_clamped = min(current_r, 1.0)
-            
-            # Map Sine distribution to Linear distribution
-            angle = math.asin(curr_r_clamped)
-            new_r = angle / (math.pi / 2.0)
-            
-            scale_factor = new_r / current_r
-            v.co.x *= scale_factor
-            v.co.y *= scale_factor
+    if not (tex and bg and out
+            and tex.outputs['Color'].is_linked
+            and tex.outputs['Color'].links[0].to_socket == bg.inputs['Color']
+            and bg.outputs['Background'].is_linked
+            and bg.outputs['Background'].links[0].to_socket == out.inputs['Surface']):
+        nodes.clear()
+        new = nodes.new
+        link = links.new
+        tex = new('ShaderNodeTexEnvironment')
+        tex.label = "VSE_Env_Tex"
+        bg = new('ShaderNodeBackground')
+        bg.label = "VSE_Background"
+        out = new('ShaderNodeOutputWorld')
+        out.label = "VSE_Output"
+        link(tex.outputs['Color'], bg.inputs['Color'])
+        link(bg.outputs['Background'], out.inputs['Surface'])
+    
+    # Half Dome darkens the world, restore it
+    bg.inputs['Strength'].default_value = 1.0
+    rebind_image(tex, image)
 
-def create_polar_shader(obj, image_path):
+def find_sun_rotation(image):
     """
-    Creates a material that maps the HDRI floor using Object Coordinates (Polar conversion).
+    Returns a Sun rotation (Euler XYZ) pointing from the brightest pixel in the
+    upper half of an equirectangular image, or None if no pixels are available.
+    The result is cached on the image, so the pixels are only read once per file.
     """
-    # clear old material if exists
-    obj.data.materials.clear()
+    cached = image.get("vse_sun_rotation")
+    if cached is not None and image.get("vse_sun_source") == image.filepath:
+        return tuple(cached)
     
-    mat = bpy.data.materials.new(name="VSE_Dome_Mat_Floor")
-    mat.use_nodes = True
-    obj.data.materials.append(mat)
+    import numpy as np
+    w, h = image.size
+    if w == 0 or h < 2:
+        return None
+    buf = np.empty(w * h * 4, dtype=np.float32)
+    image.pixels.foreach_get(buf)
+    buf = buf.reshape(h, w, 4)
     
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+    # Pixel rows run bottom to top, only look above the horizon.
+    # The full buffer is still read; only the luminance reduction is subsampled on large images.
+    step = 4 if w > 4096 else 1
+    sky = buf[h // 2::step, ::step]
+    lum = 0.2126 * sky[..., 0] + 0.7152 * sky[..., 1] + 0.0722 * sky[..., 2]
+    row, col = np.unravel_index(np.argmax(lum), lum.shape)
     
-    # --- OUTPUT ---
-    node_out = nodes.new('ShaderNodeOutputMaterial')
-    node_out.location = (800, 0)
+    # Same equirectangular mapping as the Environment Texture node
+    u = (col * step + 0.5) / w
+    v = (h // 2 + row * step + 0.5) / h
+    azimuth = (0.5 - u) * 2.0 * math.pi
+    elevation = (v - 0.5) * math.pi
     
-    node_mix = nodes.new('ShaderNodeMixShader')
-    node_mix.location = (600, 0)
-    node_mix.inputs['Fac'].default_value = 0.4 # Mix Shadows
+    # Sun shines along its local -Z, so aim local +Z at the bright spot
+    rotation = (math.pi / 2.0 - elevation, 0.0, azimuth + math.pi / 2.0)
+    image["vse_sun_rotation"] = rotation
+    image["vse_sun_source"] = image.filepath
+    return rotation
+
+def make_mesh_object(name, verts, faces, collection):
+    """Creates a mesh object from raw geometry and links it, without going through operators."""
+    data = bpy.data
+    mesh = data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    obj = data.objects.new(name, mesh)
+    collection.objects.link(obj)
+    return obj
+
+def uv_hemisphere_geometry(segments, ring_count, upper):
+    """
+    Returns (verts, faces) of the top (upper=True) or bottom half of a unit UV sphere
+    with ring_count rings: ring vertices top to bottom, then the pole.
+    The equator ring is part of both halves.
+    """
+    import numpy as np
+    half = ring_count // 2
+    rings = np.arange(1, half + 1) if upper else np.arange(half, ring_count)
+    theta = rings * (math.pi / ring_count)
+    phi = np.arange(segments) * (2.0 * math.pi / segments)
+    sin_t = np.sin(theta)[:, None]
+    verts = np.empty((len(rings), segments, 3), dtype=np.float32)
+    verts[..., 0] = sin_t * np.cos(phi)
+    verts[..., 1] = sin_t * np.sin(phi)
+    verts[..., 2] = np.cos(theta)[:, None]
+    verts = verts.reshape(-1, 3).tolist()
     
-    node_emit = nodes.new('ShaderNodeEmission')
-    node_emit.location = (400, 150)
+    pole = len(verts)
+    verts.append((0.0, 0.0, 1.0 if upper else -1.0))
     
-    node_diff = nodes.new('ShaderNodeBsdfDiffuse')
-    node_diff.location = (400, -150)
+    def idx(ring, seg):
+        return ring * segments + seg % segments
     
-    # --- IMAGE ---
-    node_tex = nodes.new('ShaderNodeTexImage')
-    node_tex.location = (200, 0)
-    try:
-        node_tex.image = bpy.data.images.load(image_path)
-        node_tex.extension = 'CLIP'
-        node_tex.interpolation = 'Linear'
-    except:
-        pass
+    last = len(rings) - 1
+    faces = []
+    if upper:
+        faces += [(pole, idx(0, j), idx(0, j + 1)) for j in range(segments)]
+    for i in range(last):
+        for j in range(segments):
+            faces.append((idx(i, j), idx(i + 1, j), idx(i + 1, j + 1), idx(i, j + 1)))
+    if not upper:
+        faces += [(pole, idx(last, j + 1), idx(last, j)) for j in range(segments)]
+    return verts, faces
 
-    # --- POLAR MATH (Object Coords) ---
-    node_coord = nodes.new('ShaderNodeTexCoord')
-    node_coord.location = (-1400, 0)
+def set_smooth_shading(mesh):
+    import numpy as np
+    mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=np.bool_))
+    mesh.update()
+
+def flatten_floor_geometry(obj):
+    """
+    Flattens the floor half-sphere onto z = 0 and redistributes its vertex rings
+    from a Sine distribution to a Linear distribution (ArcSin), in a single pass
+    over the vertex buffer. Baking z = 0 keeps a well-conditioned object
+    transform instead of a zero Z scale.
+    """
+    import numpy as np
+    mesh = obj.data
+    n = len(mesh.vertices)
+    co = np.empty(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(n, 3)
     
-    # Rotation Correction (-90 deg Z)
-    node_map_rot = nodes.new('ShaderNodeMapping')
-    node_map_rot.location = (-1200, 0)
-    node_map_rot.inputs['Rotation'].default_value[2] = math.radians(-90) 
+    # Get current radius (0.0 to 1.0), skip the center
+    r = np.hypot(co[:, 0], co[:, 1])
+    mask = r > 0.0001
     
-    node_sep = nodes.new('ShaderNodeSeparateXYZ')
-    node_sep.location = (-1000, 0)
+    # Clamp to 1.0 to avoid math domain errors, then
+    # map Sine distribution to Linear distribution
+    scale_factor = np.ones(n, dtype=np.float32)
+    scale_factor[mask] = (np.arcsin(np.minimum(r[mask], 1.0)) / (math.pi / 2.0)) / r[mask]
+    co[:, 0] *= scale_factor
+    co[:, 1] *= scale_factor
+    co[:, 2] = 0.0
     
-    # 1. ANGLE (U Coordinate)
-    node_atan = nodes.new('ShaderNodeMath')
-    node_atan.operation = 'ARCTAN2'
-    node_atan.location = (-800, 150)
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.update()
+
+def assign_material(obj, mat):
+    """Puts mat in the first material slot of obj."""
+    if obj.data.materials:
+        obj.data.materials[0] = mat
+    else:
+        obj.data.materials.append(mat)
+
+def set_material_image(mat, image_path):
+    tex = mat.node_tree.nodes[NODE_IMAGE]
+    try: rebind_image(tex, load_image_cached(image_path))
+    except: pass
+
+# --- Node Tree Specs ---
+# Nodes: (key, type, location, properties, input defaults)
+# Links: (from key, output, to key, input)
+
+# Floor: maps the HDRI using Object Coordinates (Polar conversion)
+POLAR_FLOOR_NODES = [
+    # --- OUTPUT ---
+    ('out', 'ShaderNodeOutputMaterial', (800, 0), {}, {}),
+    ('mix', 'ShaderNodeMixShader', (600, 0), {}, {'Fac': 0.4}), # Mix Shadows
+    ('emit', 'ShaderNodeEmission', (400, 150), {}, {}),
+    ('diff', 'ShaderNodeBsdfDiffuse', (400, -150), {}, {}),
     
-    node_range_u = nodes.new('ShaderNodeMapRange')
-    node_range_u.location = (-600, 150)
-    node_range_u.inputs[1].default_value = -math.pi
-    node_range_u.inputs[2].default_value = math.pi
-    node_range_u.inputs[3].default_value = 0.0
-    node_range_u.inputs[4].default_value = 1.0
+    # --- IMAGE ---
+    ('tex', 'ShaderNodeTexImage', (200, 0),
+        {'name': NODE_IMAGE, 'extension': 'CLIP', 'interpolation': 'Linear'}, {}),
     
-    # 2. RADIUS (V Coordinate)
-    node_len = nodes.new('ShaderNodeVectorMath')
-    node_len.operation = 'LENGTH'
-    node_len.location = (-800, -150)
+    # --- POLAR MATH (Object Coords) ---
+    ('coord', 'ShaderNodeTexCoord', (-1400, 0), {}, {}),
+    ('sep', 'ShaderNodeSeparateXYZ', (-1000, 0), {}, {}),
     
-    node_mult_v = nodes.new('ShaderNodeMath')
-    node_mult_v.operation = 'MULTIPLY'
-    node_mult_v.location = (-600, -150)
-    node_mult_v.inputs[1].default_value = 0.5
+    # 1. ANGLE (U Coordinate)
+    # Rotation Correction (-90 deg Z) is folded in: atan2(-X, Y) == -atan2(X, Y),
+    # so U = atan2(X, Y) * -1/(2*pi) + 0.5 maps [-pi, pi] to [1, 0] in one step.
+    ('atan', 'ShaderNodeMath', (-800, 150), {'operation': 'ARCTAN2'}, {}),
+    ('mad_u', 'ShaderNodeMath', (-600, 150), {'operation': 'MULTIPLY_ADD'},
+        {1: -1.0 / (2.0 * math.pi), 2: 0.5}),
     
-    # Combine
-    node_comb = nodes.new('ShaderNodeCombineXYZ')
-    node_comb.location = (-400, 0)
+    # 2. RADIUS (V Coordinate)
+    ('len', 'ShaderNodeVectorMath', (-800, -150), {'operation': 'LENGTH'}, {}),
+    ('mult_v', 'ShaderNodeMath', (-600, -150), {'operation': 'MULTIPLY'}, {1: 0.5}),
     
-    # --- LINKS ---
-    links.new(node_coord.outputs['Object'], node_map_rot.inputs['Vector'])
-    links.new(node_map_rot.outputs['Vector'], node_sep.inputs['Vector'])
+    # Combine
+    ('comb', 'ShaderNodeCombineXYZ', (-400, 0), {}, {}),
+]
+
+POLAR_FLOOR_LINKS = [
+    ('coord', 'Object', 'sep', 'Vector'),
     
     # U Path
-    links.new(node_sep.outputs['Y'], node_atan.inputs[0])
-    links.new(node_sep.outputs['X'], node_atan.inputs[1])
-    links.new(node_atan.outputs['Value'], node_range_u.inputs[0])
-    links.new(node_range_u.outputs['Result'], node_comb.inputs['X'])
+    ('sep', 'X', 'atan', 0),
+    ('sep', 'Y', 'atan', 1),
+    ('atan', 'Value', 'mad_u', 0),
+    ('mad_u', 'Value', 'comb', 'X'),
     
     # V Path
-    links.new(node_map_rot.outputs['Vector'], node_len.inputs[0])
-    links.new(node_len.outputs['Value'], node_mult_v.inputs[0])
-    links.new(node_mult_v.outputs['Value'], node_comb.inputs['Y'])
+    ('coord', 'Object', 'len', 0),
+    ('len', 'Value', 'mult_v', 0),
+    ('mult_v', 'Value', 'comb', 'Y'),
     
     # Texture
-    links.new(node_comb.outputs['Vector'], node_tex.inputs['Vector'])
-    links.new(node_tex.outputs['Color'], node_emit.inputs['Color'])
-    links.new(node_tex.outputs['Color'], node_diff.inputs['Color'])
+    ('comb', 'Vector', 'tex', 'Vector'),
+    ('tex', 'Color', 'emit', 'Color'),
+    ('tex', 'Color', 'diff', 'Color'),
     
     # Material
-    links.new(node_emit.outputs['Emission'], node_mix.inputs[1])
-    links.new(node_diff.outputs['BSDF'], node_mix.inputs[2])
-    links.new(node_mix.outputs['Shader'], node_out.inputs['Surface'])
+    ('emit', 'Emission', 'mix', 1),
+    ('diff', 'BSDF', 'mix', 2),
+    ('mix', 'Shader', 'out', 'Surface'),
+]
 
+DOME_SHELL_NODES = [
+    ('tex', 'ShaderNodeTexEnvironment', (0, 0), {'name': NODE_IMAGE}, {}),
+    ('coord', 'ShaderNodeTexCoord', (-200, 0), {}, {}),
+    ('emit', 'ShaderNodeEmission', (300, 0), {}, {}),
+    ('out', 'ShaderNodeOutputMaterial', (500, 0), {}, {}),
+]
 
-def create_dome_shell_mat(obj, image_path):
-    obj.data.materials.clear()
-    mat = bpy.data.materials.new(name="VSE_Dome_Mat_Shell")
-    mat.use_nodes = True
-    obj.data.materials.append(mat)
-    nodes = mat.node_tree.nodes
+DOME_SHELL_LINKS = [
+    ('coord', 'Object', 'tex', 'Vector'),
+    ('tex', 'Color', 'emit', 'Color'),
+    ('emit', 'Emission', 'out', 'Surface'),
+]
+
+def build_node_tree(node_tree, nodes_spec, links_spec):
+    """
+    Clears node_tree and rebuilds it from a nodes/links spec in one pass.
+    Returns the created nodes by key.
+    """
+    nodes = node_tree.nodes
     nodes.clear()
+    new = nodes.new
+    link = node_tree.links.new
     
-    tex = nodes.new('ShaderNodeTexEnvironment')
-    try: tex.image = bpy.data.images.load(image_path)
-    except: pass
+    created = {}
+    for key, node_type, location, props, inputs in nodes_spec:
+        node = new(node_type)
+        node.location = location
+        for attr, value in props.items():
+            setattr(node, attr, value)
+        for socket, value in inputs.items():
+            node.inputs[socket].default_value = value
+        created[key] = node
     
-    coord = nodes.new('ShaderNodeTexCoord')
-    emit = nodes.new('ShaderNodeEmission')
-    out = nodes.new('ShaderNodeOutputMaterial')
+    for from_key, from_socket, to_key, to_socket in links_spec:
+        link(created[from_key].outputs[from_socket], created[to_key].inputs[to_socket])
+    return created
+
+def spec_hash(nodes_spec, links_spec):
+    """
+    Returns a checksum of a node tree spec that is stable across sessions,
+    masked to fit a (signed 32-bit) ID property.
+    """
+    return zlib.crc32(repr((nodes_spec, links_spec)).encode()) & 0x7FFFFFFF
+
+def get_or_build_material(name, nodes_spec, links_spec):
+    """
+    Returns the material by name, rebuilding its node tree from the spec only if it
+    doesn't exist yet or was built from a different version of the spec.
+    Without a fake user, it is dropped on save once no dome object uses it.
+    """
+    materials = bpy.data.materials
+    mat = materials.get(name)
+    if mat is None:
+        mat = materials.new(name=name)
+    # Earlier versions pinned these materials with a fake user
+    if mat.use_fake_user: mat.use_fake_user = False
+    if not mat.use_nodes: mat.use_nodes = True
     
-    mat.node_tree.links.new(coord.outputs['Object'], tex.inputs['Vector'])
-    mat.node_tree.links.new(tex.outputs['Color'], emit.inputs['Color'])
-    mat.node_tree.links.new(emit.outputs['Emission'], out.inputs['Surface'])
+    checksum = spec_hash(nodes_spec, links_spec)
+    if mat.get("vse_spec") != checksum or mat.node_tree.nodes.get(NODE_IMAGE) is None:
+        build_node_tree(mat.node_tree, nodes_spec, links_spec)
+        mat["vse_spec"] = checksum
+    return mat
+
+
+def create_polar_shader(obj, image_path):
+    """
+    Assigns the floor material to obj, only rebinding the HDRI if it already exists.
+    """
+    mat = get_or_build_material(MAT_DOME_FLOOR, POLAR_FLOOR_NODES, POLAR_FLOOR_LINKS)
+    assign_material(obj, mat)
+    set_material_image(mat, image_path)
+
+
+def create_dome_shell_mat(obj, image_path):
+    mat = get_or_build_material(MAT_DOME_SHELL, DOME_SHELL_NODES, DOME_SHELL_LINKS)
+    assign_material(obj, mat)
+    set_material_image(mat, image_path)
 
 
 class VSE_OT_ConvertToEnvironment(bpy.types.Operator):
@@ -203,26 +393,26 @@ class VSE_OT_ConvertToEnvironment(bpy.types.Operator):
         setup_cycles()
         
         # Cleanup
-        delete_existing_object(NAME_ENV_CATCHER)
+        delete_existing_objects([NAME_ENV_CATCHER])
 
         # World
-        world = bpy.context.scene.world or bpy.data.worlds.new("VSE_World")
-        bpy.context.scene.world = world
-        world.use_nodes = True
-        nodes = world.node_tree.nodes
-        nodes.clear()
-        tex = nodes.new('ShaderNodeTexEnvironment')
-        try: tex.image = bpy.data.images.load(filepath)
-        except: pass
-        bg = nodes.new('ShaderNodeBackground')
-        out = nodes.new('ShaderNodeOutputWorld')
-        world.node_tree.links.new(tex.outputs['Color'], bg.inputs['Color'])
-        world.node_tree.links.new(bg.outputs['Background'], out.inputs['Surface'])
+        scene = context.scene
+        world = scene.world or bpy.data.worlds.new("VSE_World")
+        scene.world = world
+        if not world.use_nodes: world.use_nodes = True
+        try: image = load_image_cached(filepath)
+        except: image = None
+        ensure_world_nodes(world, image)
         
         # Create Plane
-        bpy.ops.mesh.primitive_plane_add(size=100)
-        plane = context.active_object
-        plane.name = NAME_ENV_CATCHER
+        half = 50.0
+        plane = make_mesh_object(
+            NAME_ENV_CATCHER,
+            [(-half, -half, 0), (half, -half, 0), (half, half, 0), (-half, half, 0)],
+            [(0, 1, 2, 3)],
+            context.collection,
+        )
+        plane.location = scene.cursor.location
         plane.is_shadow_catcher = True
         return {'FINISHED'}
 
@@ -240,70 +430,52 @@ class VSE_OT_ConvertToHalfDome(bpy.types.Operator):
         setup_cycles()
         
         # Cleanup Existing
-        delete_existing_object(NAME_DOME_SHELL)
-        delete_existing_object(NAME_DOME_FLOOR)
-        delete_existing_object(NAME_SUN)
+        delete_existing_objects([NAME_DOME_SHELL, NAME_DOME_FLOOR, NAME_SUN])
 
         # Environment Darkening
-        if not bpy.context.scene.world: bpy.context.scene.world = bpy.data.worlds.new("Dark")
-        bpy.context.scene.world.use_nodes = True
-        bg = bpy.context.scene.world.node_tree.nodes.get('Background')
+        scene = context.scene
+        if not scene.world: scene.world = bpy.data.worlds.new("Dark")
+        world = scene.world
+        if not world.use_nodes: world.use_nodes = True
+        bg = world.node_tree.nodes.get('Background')
         if bg: bg.inputs[1].default_value = 0.0
 
         # Geometry
-        bpy.ops.mesh.primitive_uv_sphere_add(segments=64, ring_count=32, radius=1)
-        dome = context.active_object
-        dome.name = NAME_DOME_SHELL # Temporary name until separation
-        dome.scale = (20, 20, 20)
-        bpy.ops.object.shade_smooth()
+        collection = context.collection
+        shell_verts, shell_faces = uv_hemisphere_geometry(segments=64, ring_count=32, upper=True)
+        floor_verts, floor_faces = uv_hemisphere_geometry(segments=64, ring_count=32, upper=False)
         
-        # Separate Floor
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bm = bmesh.from_edit_mesh(dome.data)
-        # Select bottom half
-        for f in bm.faces:
-            if f.calc_center_median().z <= 0.001: f.select = True
-        bpy.ops.mesh.separate(type='SELECTED')
-        bpy.ops.object.mode_set(mode='OBJECT')
+        dome = make_mesh_object(NAME_DOME_SHELL, shell_verts, shell_faces, collection)
+        dome.scale = (20, 20, 20)
+        set_smooth_shading(dome.data)
         
-        # Handle Objects after separation
-        # selected_objects usually contains [Original(Unselected), New(Selected)]
-        # We need to find which is which.
-        objects = context.selected_objects
+        floor = make_mesh_object(NAME_DOME_FLOOR, floor_verts, floor_faces, collection)
+        floor.scale = (20, 20, 20)
+        set_smooth_shading(floor.data)
         
-        # The object that remains 'dome' is the one we started with. 
-        # The new object is the separated part.
-        floor = None
-        for obj in objects:
-            if obj != dome:
-                floor = obj
-                break
+        # Like primitive_uv_sphere_add, place the dome at the 3D cursor
+        dome.location = floor.location = scene.cursor.location
         
-        # Rename strictly
-        dome.name = NAME_DOME_SHELL
-        if floor:
-            floor.name = NAME_DOME_FLOOR
+        # Flatten Floor and fix Floor Rings (Linearize)
+        flatten_floor_geometry(floor)
         
-            # Flatten Floor
-            floor.scale.z = 0
-            
-            # Fix Floor Rings (Linearize)
-            redistribute_floor_geometry(floor)
-            
-            # Apply Materials
-            create_polar_shader(floor, filepath)
-            floor.visible_shadow = False
+        # Apply Materials
+        create_polar_shader(floor, filepath)
+        floor.visible_shadow = False
         
         create_dome_shell_mat(dome, filepath)
         dome.visible_shadow = False
         
         # Add Sun
-        bpy.ops.object.light_add(type='SUN', location=(0, 0, 10))
-        sun = context.active_object
-        sun.name = NAME_SUN
-        sun.data.energy = 3.0
-        sun.rotation_euler = (math.radians(45), math.radians(15), 0)
+        light = bpy.data.lights.new(NAME_SUN, type='SUN')
+        light.energy = 3.0
+        sun = bpy.data.objects.new(NAME_SUN, light)
+        collection.objects.link(sun)
+        sun.location = (0, 0, 10)
+        # Movie images have no pixel buffer to read, keep the default angle then
+        try: rotation = find_sun_rotation(load_image_cached(filepath))
+        except (RuntimeError, ValueError): rotation = None
+        sun.rotation_euler = rotation or (math.radians(45), math.radians(15), 0)
         
         self.report({'INFO'}, "Half Dome Setup Complete")
         return {'FINISHED'}